@@ -1,13 +1,19 @@
-from fastapi import FastAPI, HTTPException, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import List, Literal, Optional
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, field_validator
+from typing import AsyncIterator, Callable, List, Literal, Optional
 from datetime import date
+import hashlib
 import os
-import re
+import string
+from uuid import uuid4
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import (
-    create_engine,
+    BigInteger,
     Column,
     String,
     Integer,
@@ -15,23 +21,111 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     UniqueConstraint,
+    func,
+    or_,
+    select,
+    tuple_,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.pool import NullPool
 
 load_dotenv()
 # ── Database configuration ─────────────────────────────────────────────────────
 DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# libpq URL parameters asyncpg names differently
+_LIBPQ_RENAMED_PARAMS = {"sslmode": "ssl"}
+# libpq URL parameters removed from the URL: asyncpg has no channel_binding
+# setting, and connect_timeout goes through async_connect_args() because
+# URL query values reach asyncpg as strings and its timeout must be a number
+_LIBPQ_DROPPED_PARAMS = {"channel_binding", "connect_timeout"}
+# libpq URL parameters that change connection behaviour but that asyncpg
+# would reject with a TypeError on first connect
+_LIBPQ_UNSUPPORTED_PARAMS = {
+    "application_name",
+    "gssencmode",
+    "keepalives",
+    "keepalives_count",
+    "keepalives_idle",
+    "keepalives_interval",
+    "krbsrvname",
+    "options",
+    "passfile",
+    "requiressl",
+    "service",
+    "sslcert",
+    "sslcrl",
+    "sslkey",
+    "sslrootcert",
+}
+
+
+def async_database_url(url: str) -> URL:
+    """Point a postgres:// or postgresql:// URL at the asyncpg driver."""
+    url = make_url(url).set(drivername="postgresql+asyncpg")
+    unsupported = sorted(_LIBPQ_UNSUPPORTED_PARAMS.intersection(url.query))
+    if unsupported:
+        raise ValueError(
+            "DATABASE_URL parameters not supported by asyncpg: "
+            + ", ".join(unsupported)
+        )
+    for libpq_name, asyncpg_name in _LIBPQ_RENAMED_PARAMS.items():
+        if libpq_name in url.query:
+            url = url.update_query_dict({asyncpg_name: url.query[libpq_name]})
+            url = url.difference_update_query([libpq_name])
+    return url.difference_update_query(_LIBPQ_DROPPED_PARAMS)
+
+
+def async_connect_args(url: str) -> dict:
+    """asyncpg connect() keywords for libpq parameters needing typed values."""
+    timeout = make_url(url).query.get("connect_timeout")
+    return {"timeout": float(timeout)} if timeout else {}
+
+
+# When Postgres sits behind PgBouncer (USE_PGBOUNCER=1) the bouncer already
+# pools server connections, so keep no client-side pool of our own. Its
+# transaction pooling mode also breaks asyncpg's prepared statement cache, and
+# asyncpg's sequential statement names collide across server backends, so
+# every prepared statement gets a unique name instead.
+if os.getenv("USE_PGBOUNCER") == "1":
+    engine = create_async_engine(
+        async_database_url(DATABASE_URL).update_query_dict(
+            {"prepared_statement_cache_size": "0"}
+        ),
+        poolclass=NullPool,
+        connect_args={
+            **async_connect_args(DATABASE_URL),
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    )
+else:
+    engine = create_async_engine(
+        async_database_url(DATABASE_URL),
+        connect_args=async_connect_args(DATABASE_URL),
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # ── ORM models ─────────────────────────────────────────────────────────────────
@@ -50,34 +144,93 @@ class EmployeeModel(Base):
     )
 
 
+class EmployeesVersionModel(Base):
+    """Single row (id=1) whose version is bumped on every employee write."""
+
+    __tablename__ = "employees_version"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False)
+
+
 class AttendanceModel(Base):
     __tablename__ = "attendance"
     __table_args__ = (
+        # Its (employee_id, date) index also serves per-employee lookups
         UniqueConstraint("employee_id", "date", name="uq_employee_date"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"))
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, index=True)
     status = Column(String, nullable=False)
 
     employee = relationship("EmployeeModel", back_populates="attendance_records")
 
 
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Creating tables costs a round of catalog queries on every worker start;
+    # only do it when asked (CREATE_SCHEMA=1), e.g. on a fresh database.
+    if os.getenv("CREATE_SCHEMA") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    else:
+        # employees_version was added after databases were already deployed;
+        # one IF NOT EXISTS statement adds it without a catalog round-trip.
+        async with engine.begin() as conn:
+            await conn.execute(
+                CreateTable(EmployeesVersionModel.__table__, if_not_exists=True)
+            )
+    yield
+    await engine.dispose()
 
 
-app = FastAPI(title="HRMS Lite API", version="1.0.0")
+app = FastAPI(
+    title="HRMS Lite API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # ── Schemas ──────────────────────────────────────────────────────────────────
 
+# Characters allowed on each side of the "@" in an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_lowercase + string.digits + "_.+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_lowercase + string.digits + "-.")
+
+
+def normalize(v: str, lower: bool = False) -> str:
+    """Strip surrounding whitespace, lower-casing only if anything is upper."""
+    v = v.strip()
+    # islower() scans without allocating; lower() always builds a new string
+    if lower and not v.islower():
+        v = v.lower()
+    return v
+
+
+def is_valid_email(v: str) -> bool:
+    """Check a lower-cased address has the shape local@label.rest."""
+    local, _, domain = v.partition("@")
+    label, _, rest = domain.partition(".")
+    return bool(
+        local
+        and label
+        and rest
+        and not domain.endswith(".")
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(domain)
+    )
+
+
 class EmployeeCreate(BaseModel):
     employee_id: str
     full_name: str
@@ -87,7 +240,7 @@ class EmployeeCreate(BaseModel):
     @field_validator("employee_id")
     @classmethod
     def validate_employee_id(cls, v):
-        v = v.strip()
+        v = normalize(v)
         if not v:
             raise ValueError("Employee ID is required")
         return v
@@ -95,7 +248,7 @@ class EmployeeCreate(BaseModel):
     @field_validator("full_name")
     @classmethod
     def validate_full_name(cls, v):
-        v = v.strip()
+        v = normalize(v)
         if not v:
             raise ValueError("Full name is required")
         return v
@@ -103,16 +256,15 @@ class EmployeeCreate(BaseModel):
     @field_validator("email")
     @classmethod
     def validate_email(cls, v):
-        v = v.strip().lower()
-        pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if not re.match(pattern, v):
+        v = normalize(v, lower=True)
+        if not is_valid_email(v):
             raise ValueError("Invalid email format")
         return v
 
     @field_validator("department")
     @classmethod
     def validate_department(cls, v):
-        v = v.strip()
+        v = normalize(v)
         if not v:
             raise ValueError("Department is required")
         return v
@@ -130,70 +282,328 @@ class AttendanceCreate(BaseModel):
     @field_validator("employee_id")
     @classmethod
     def validate_employee_id(cls, v):
-        if not v.strip():
+        v = normalize(v)
+        if not v:
             raise ValueError("Employee ID is required")
-        return v.strip()
+        return v
 
     @field_validator("date")
     @classmethod
     def validate_date(cls, v):
         try:
-            date.fromisoformat(v)
+            return date.fromisoformat(v).isoformat()
         except ValueError:
             raise ValueError("Invalid date format. Use YYYY-MM-DD")
-        return v
 
 
 class AttendanceRecord(AttendanceCreate):
     pass
 
 
-# ── Routes ───────────────────────────────────────────────────────────────────
-
-@app.get("/")
-def root():
-    return {"message": "HRMS Lite API is running", "version": "1.0.0"}
-
+# ── Employee lookups ─────────────────────────────────────────────────────────
+
+# Maps public employee_id -> employees.id so attendance writes can skip the
+# lookup query. Entries are dropped on create/delete; the cache is per-process,
+# so writes still guard against a row deleted by another worker.
+_EMP_PK_CACHE: dict[str, int] = {}
+_EMP_PK_CACHE_MAX = 10_000
+
+# Postgres caps a statement at 32767 bind parameters, so bulk lookups and
+# attendance inserts (3 parameters per row) are issued in chunks of this size.
+_SQL_CHUNK = 5000
+
+
+async def get_employee_pks(
+    db: AsyncSession, employee_ids: List[str]
+) -> dict[str, int]:
+    """Resolve employee_ids to primary keys; unknown IDs are left out."""
+    pks = {}
+    misses = []
+    for employee_id in employee_ids:
+        pk = _EMP_PK_CACHE.get(employee_id)
+        if pk is None:
+            misses.append(employee_id)
+        else:
+            pks[employee_id] = pk
+
+    rows = []
+    for i in range(0, len(misses), _SQL_CHUNK):
+        result = await db.execute(
+            select(EmployeeModel.employee_id, EmployeeModel.id).where(
+                EmployeeModel.employee_id.in_(misses[i : i + _SQL_CHUNK])
+            )
+        )
+        rows.extend(result.all())
+    if len(_EMP_PK_CACHE) + len(rows) > _EMP_PK_CACHE_MAX:
+        _EMP_PK_CACHE.clear()
+    for employee_id, pk in rows:
+        pks[employee_id] = pk
+        # A single huge bulk lookup must not grow the cache past its bound
+        if len(_EMP_PK_CACHE) < _EMP_PK_CACHE_MAX:
+            _EMP_PK_CACHE[employee_id] = pk
+    return pks
+
+
+async def bump_employees_version(db: AsyncSession) -> None:
+    """Advance the employees version inside the caller's transaction."""
+    stmt = insert(EmployeesVersionModel).values(id=1, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={"version": EmployeesVersionModel.version + 1},
+    )
+    await db.execute(stmt)
+
+
+async def find_employee_conflict(
+    db: AsyncSession, data: EmployeeCreate
+) -> Optional[HTTPException]:
+    """Return the 409 to raise if data's employee_id or email is taken."""
+    result = await db.execute(
+        select(EmployeeModel.employee_id)
+        .where(
+            or_(
+                EmployeeModel.employee_id == data.employee_id,
+                EmployeeModel.email == data.email,
+            )
+        )
+        .limit(2)
+    )
+    taken_ids = result.scalars().all()
+    if data.employee_id in taken_ids:
+        return HTTPException(
+            status_code=409,
+            detail=f"Employee with ID '{data.employee_id}' already exists",
+        )
+    if taken_ids:
+        return HTTPException(
+            status_code=409,
+            detail=f"Email '{data.email}' is already registered",
+        )
+    return None
 
-# Employees
 
-@app.get("/employees", response_model=List[Employee])
-def list_employees(db: Session = Depends(get_db)):
-    employees = db.query(EmployeeModel).all()
-    return [
-        Employee(
-            employee_id=e.employee_id,
-            full_name=e.full_name,
-            email=e.email,
-            department=e.department,
+def employees_not_found(employee_ids: List[str]) -> HTTPException:
+    if len(employee_ids) == 1:
+        return HTTPException(
+            status_code=404, detail=f"Employee '{employee_ids[0]}' not found"
         )
-        for e in employees
-    ]
+    return HTTPException(
+        status_code=404,
+        detail="Employees not found: "
+        + ", ".join(f"'{e}'" for e in employee_ids),
+    )
 
 
-@app.post("/employees", response_model=Employee, status_code=201)
-def create_employee(data: EmployeeCreate, db: Session = Depends(get_db)):
-    # Check duplicate employee_id
-    existing_by_id = (
-        db.query(EmployeeModel)
-        .filter(EmployeeModel.employee_id == data.employee_id)
-        .first()
-    )
-    if existing_by_id:
+async def write_attendance(
+    db: AsyncSession, pks: dict[str, int], latest: dict[tuple, str]
+) -> None:
+    # Insert or overwrite each day's status with one statement per chunk,
+    # relying on uq_employee_date instead of a SELECT-then-INSERT/UPDATE per
+    # record. All chunks share one transaction.
+    values = [
+        {"employee_id": pks[employee_id], "date": day, "status": status}
+        for (employee_id, day), status in latest.items()
+    ]
+    for i in range(0, len(values), _SQL_CHUNK):
+        stmt = insert(AttendanceModel).values(values[i : i + _SQL_CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["employee_id", "date"],
+            set_={"status": stmt.excluded.status},
+        )
+        await db.execute(stmt)
+    await db.commit()
+
+
+async def upsert_attendance(
+    db: AsyncSession, records: List[AttendanceCreate]
+) -> List[dict]:
+    # Postgres rejects an ON CONFLICT statement that touches the same row
+    # twice, so collapse repeated (employee, date) pairs, last one wins.
+    latest = {}
+    for r in records:
+        latest[(r.employee_id, date.fromisoformat(r.date))] = r.status
+
+    employee_ids = list(dict.fromkeys(r.employee_id for r in records))
+    for attempt in range(2):
+        from_cache = [e for e in employee_ids if e in _EMP_PK_CACHE]
+        pks = await get_employee_pks(db, employee_ids)
+        missing = [e for e in employee_ids if e not in pks]
+        if missing:
+            raise employees_not_found(missing)
+        try:
+            await write_attendance(db, pks, latest)
+            break
+        except IntegrityError:
+            # A cached primary key went stale: another worker deleted the
+            # employee, possibly re-creating the same employee_id. Drop the
+            # entries served from the cache (the rest were just read) and
+            # look them up again before retrying once; only IDs that are
+            # really gone are reported as missing.
+            await db.rollback()
+            for employee_id in from_cache:
+                _EMP_PK_CACHE.pop(employee_id, None)
+    else:
+        for employee_id in employee_ids:
+            _EMP_PK_CACHE.pop(employee_id, None)
         raise HTTPException(
             status_code=409,
-            detail=f"Employee with ID '{data.employee_id}' already exists",
+            detail="Employees changed during the request, please retry",
         )
 
-    # Check duplicate email
-    existing_by_email = (
-        db.query(EmployeeModel).filter(EmployeeModel.email == data.email).first()
+    return [
+        {"employee_id": employee_id, "date": day, "status": status}
+        for (employee_id, day), status in latest.items()
+    ]
+
+
+def bad_cursor() -> HTTPException:
+    return HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(
+        "\0".join(map(str, parts)).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 if the request's If-None-Match already has etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def employee_row(r) -> dict:
+    return {
+        "employee_id": r.employee_id,
+        "full_name": r.full_name,
+        "email": r.email,
+        "department": r.department,
+    }
+
+
+def attendance_row(r) -> dict:
+    return {"employee_id": r.employee_id, "date": r.date, "status": r.status}
+
+
+async def json_array_chunks(
+    db: AsyncSession, result, to_dict: Callable[..., dict]
+) -> AsyncIterator[bytes]:
+    """Encode result's rows as a JSON array, one chunk per batch of rows."""
+    try:
+        yield b"["
+        sep = b""
+        async for rows in result.partitions():
+            yield sep + b",".join(orjson.dumps(to_dict(r)) for r in rows)
+            sep = b","
+        yield b"]"
+    finally:
+        await db.close()
+
+
+async def stream_json_array(
+    query, to_dict: Callable[..., dict], headers: Optional[dict] = None
+) -> StreamingResponse:
+    # Uses its own session: FastAPI closes get_db's session as soon as the
+    # handler returns, before the body is streamed. The query is started
+    # here, so database errors still fail the request before any status or
+    # headers are sent.
+    db = SessionLocal()
+    try:
+        result = await db.stream(query.execution_options(yield_per=1000))
+    except BaseException:
+        await db.close()
+        raise
+    return StreamingResponse(
+        json_array_chunks(db, result, to_dict),
+        media_type="application/json",
+        headers=headers,
+        # Closes the session if the client leaves before the body starts
+        background=BackgroundTask(db.close),
     )
-    if existing_by_email:
-        raise HTTPException(
-            status_code=409,
-            detail=f"Email '{data.email}' is already registered",
+
+
+# ── Routes ───────────────────────────────────────────────────────────────────
+
+@app.get("/")
+async def root():
+    return {"message": "HRMS Lite API is running", "version": "1.0.0"}
+
+
+# Employees
+
+# Response models are only documented: rows read back from the database (or
+# request bodies that already passed validation) are returned as plain dicts
+# rather than being validated a second time on the way out.
+
+# List endpoints page with ?limit=N; when more rows remain, the X-Next-Cursor
+# response header carries the value to pass back as ?cursor= for the next page.
+# Paging is keyset-based, so later pages cost the same as the first. Without a
+# limit the full list is streamed from a server-side cursor in batches.
+
+@app.get("/employees", responses={200: {"model": List[Employee]}})
+async def list_employees(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    # A primary-key read of the version row, bumped in the same transaction
+    # as every employee create/delete, rather than an aggregate over the table
+    version = (
+        await db.execute(
+            select(EmployeesVersionModel.version).where(
+                EmployeesVersionModel.id == 1
+            )
         )
+    ).scalar_one_or_none()
+    etag = make_etag(version or 0, limit, cursor)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    query = select(
+        EmployeeModel.id,
+        EmployeeModel.employee_id,
+        EmployeeModel.full_name,
+        EmployeeModel.email,
+        EmployeeModel.department,
+    ).order_by(EmployeeModel.id)
+
+    if cursor:
+        try:
+            after_id = int(cursor)
+        except ValueError:
+            raise bad_cursor()
+        query = query.where(EmployeeModel.id > after_id)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if not limit:
+        # Hand this session's connection back before the stream takes its
+        # own, so a request never holds two pooled connections at once.
+        await db.close()
+        return await stream_json_array(query, employee_row, headers)
+
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = str(rows[-1].id)
+
+    return ORJSONResponse([employee_row(r) for r in rows], headers=headers)
+
+
+@app.post("/employees", status_code=201, responses={201: {"model": Employee}})
+async def create_employee(
+    data: EmployeeCreate, db: AsyncSession = Depends(get_db)
+):
+    # Check duplicate employee_id and email in one query
+    conflict = await find_employee_conflict(db, data)
+    if conflict:
+        raise conflict
 
     employee = EmployeeModel(
         employee_id=data.employee_id,
@@ -202,129 +612,151 @@ def create_employee(data: EmployeeCreate, db: Session = Depends(get_db)):
         department=data.department,
     )
     db.add(employee)
-    db.commit()
-    db.refresh(employee)
-
-    return Employee(
-        employee_id=employee.employee_id,
-        full_name=employee.full_name,
-        email=employee.email,
-        department=employee.department,
+    try:
+        await bump_employees_version(db)
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent insert of the same ID or email
+        await db.rollback()
+        raise await find_employee_conflict(db, data) or HTTPException(
+            status_code=409, detail="Employee already exists"
+        )
+    _EMP_PK_CACHE.pop(data.employee_id, None)
+
+    # Every returned field is one we just wrote, so there is nothing to
+    # reload from the database; pydantic-core serializes the body directly.
+    return Response(
+        data.model_dump_json(), status_code=201, media_type="application/json"
     )
 
 
-@app.get("/employees/{employee_id}", response_model=Employee)
-def get_employee(employee_id: str, db: Session = Depends(get_db)):
-    employee = (
-        db.query(EmployeeModel)
-        .filter(EmployeeModel.employee_id == employee_id)
-        .first()
+@app.get("/employees/{employee_id}", responses={200: {"model": Employee}})
+async def get_employee(
+    employee_id: str, request: Request, db: AsyncSession = Depends(get_db)
+):
+    result = await db.execute(
+        select(
+            EmployeeModel.employee_id,
+            EmployeeModel.full_name,
+            EmployeeModel.email,
+            EmployeeModel.department,
+        ).where(EmployeeModel.employee_id == employee_id)
     )
+    employee = result.first()
     if not employee:
         raise HTTPException(
             status_code=404, detail=f"Employee '{employee_id}' not found"
         )
 
-    return Employee(
-        employee_id=employee.employee_id,
-        full_name=employee.full_name,
-        email=employee.email,
-        department=employee.department,
+    etag = make_etag(*employee)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    return ORJSONResponse(
+        dict(employee._mapping),
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
     )
 
 
 @app.delete("/employees/{employee_id}")
-def delete_employee(employee_id: str, db: Session = Depends(get_db)):
-    employee = (
-        db.query(EmployeeModel)
-        .filter(EmployeeModel.employee_id == employee_id)
-        .first()
+async def delete_employee(employee_id: str, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(EmployeeModel).where(EmployeeModel.employee_id == employee_id)
     )
+    employee = result.scalars().first()
     if not employee:
         raise HTTPException(
             status_code=404, detail=f"Employee '{employee_id}' not found"
         )
 
-    db.delete(employee)
-    db.commit()
+    await db.delete(employee)
+    await bump_employees_version(db)
+    await db.commit()
+    _EMP_PK_CACHE.pop(employee_id, None)
 
     return {"message": f"Employee '{employee_id}' deleted successfully"}
 
 
 # Attendance
 
-@app.get("/attendance", response_model=List[AttendanceRecord])
-def list_attendance(
+@app.get("/attendance", responses={200: {"model": List[AttendanceRecord]}})
+async def list_attendance(
     employee_id: Optional[str] = None,
-    date: Optional[str] = None,
-    db: Session = Depends(get_db),
+    on_date: Optional[str] = Query(None, alias="date"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    query = db.query(AttendanceModel).join(EmployeeModel)
+    # Select the needed columns through a single JOIN rather than touching
+    # rec.employee per row, which lazy-loaded one employee at a time.
+    # Postgres renders the date as text, so no date objects are built per row
+    query = (
+        select(
+            AttendanceModel.id,
+            EmployeeModel.employee_id,
+            func.to_char(AttendanceModel.date, "YYYY-MM-DD").label("date"),
+            AttendanceModel.status,
+        )
+        .join_from(AttendanceModel, EmployeeModel)
+        .order_by(AttendanceModel.date.desc(), AttendanceModel.id.desc())
+    )
 
     if employee_id:
-        query = query.filter(EmployeeModel.employee_id == employee_id)
+        query = query.where(EmployeeModel.employee_id == employee_id)
 
-    if date:
+    if on_date:
         try:
-            date_obj = date_from_str = date and date.split("T")[0]
-            date_parsed = date_obj
-        except Exception:
+            parsed = date.fromisoformat(on_date.split("T")[0])
+        except ValueError:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid date format. Use YYYY-MM-DD",
             )
-    records = query.all()
-
-    result: List[AttendanceRecord] = []
-    for rec in records:
-        result.append(
-            AttendanceRecord(
-                employee_id=rec.employee.employee_id,
-                date=rec.date.isoformat(),
-                status=rec.status,
-            )
+        query = query.where(AttendanceModel.date == parsed)
+
+    # Cursor is "<date>_<id>" of the last record on the previous page
+    if cursor:
+        cursor_date, _, cursor_id = cursor.partition("_")
+        try:
+            after = (date.fromisoformat(cursor_date), int(cursor_id))
+        except ValueError:
+            raise bad_cursor()
+        query = query.where(
+            tuple_(AttendanceModel.date, AttendanceModel.id) < tuple_(*after)
         )
-    return result
+    if not limit:
+        return await stream_json_array(query, attendance_row)
 
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = f"{rows[-1].date}_{rows[-1].id}"
 
-@app.post("/attendance", response_model=AttendanceRecord, status_code=201)
-def mark_attendance(data: AttendanceCreate, db: Session = Depends(get_db)):
-    employee = (
-        db.query(EmployeeModel)
-        .filter(EmployeeModel.employee_id == data.employee_id)
-        .first()
-    )
-    if not employee:
-        raise HTTPException(
-            status_code=404, detail=f"Employee '{data.employee_id}' not found"
-        )
+    return ORJSONResponse([attendance_row(r) for r in rows], headers=headers)
 
-    attendance_date = date.fromisoformat(data.date)
 
-    record = (
-        db.query(AttendanceModel)
-        .filter(
-            AttendanceModel.employee_id == employee.id,
-            AttendanceModel.date == attendance_date,
-        )
-        .first()
+@app.post(
+    "/attendance", status_code=201, responses={201: {"model": AttendanceRecord}}
+)
+async def mark_attendance(
+    data: AttendanceCreate, db: AsyncSession = Depends(get_db)
+):
+    await upsert_attendance(db, [data])
+    return Response(
+        data.model_dump_json(), status_code=201, media_type="application/json"
     )
 
-    if record:
-        record.status = data.status
-    else:
-        record = AttendanceModel(
-            employee_id=employee.id,
-            date=attendance_date,
-            status=data.status,
-        )
-        db.add(record)
-
-    db.commit()
-    db.refresh(record)
 
-    return AttendanceRecord(
-        employee_id=employee.employee_id,
-        date=record.date.isoformat(),
-        status=record.status,
-    )
\ No newline at end of file
+@app.post(
+    "/attendance/bulk",
+    status_code=201,
+    responses={201: {"model": List[AttendanceRecord]}},
+)
+async def mark_attendance_bulk(
+    records: List[AttendanceCreate], db: AsyncSession = Depends(get_db)
+):
+    if not records:
+        return ORJSONResponse([], status_code=201)
+    return ORJSONResponse(await upsert_attendance(db, records), status_code=201)